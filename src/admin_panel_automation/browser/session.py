@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
 import re
+import string
+import threading
+from collections import OrderedDict
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-from playwright.sync_api import BrowserContext, Error as PlaywrightError, Page, sync_playwright
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
+from admin_panel_automation.config import WEB_APP_CONFIG
 from admin_panel_automation.models import BrowserType
 
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page, Playwright, Route
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppPaths:
     """Filesystem paths used by the app.
 
@@ -26,20 +36,44 @@ class AppPaths:
 
     @staticmethod
     def default() -> "AppPaths":
-        """Create default paths appropriate for the current OS/user."""
-        import os
+        """Create default paths appropriate for the current OS/user (resolved once per process)."""
+        return _default_paths()
 
-        if os.name == "nt":
-            root = Path(os.environ.get("LOCALAPPDATA", str(Path.home())))
-        else:
-            root = Path.home()
-        return AppPaths(data_dir=root / "AdminPanelAutomation")
+
+@functools.lru_cache(maxsize=1)
+def _default_paths() -> AppPaths:
+    """Build `AppPaths.default()`; cached because the environment lookup never changes at runtime."""
+    if os.name == "nt":
+        root = Path(os.environ.get("LOCALAPPDATA", str(Path.home())))
+    else:
+        root = Path.home()
+    return AppPaths(data_dir=root / "AdminPanelAutomation")
+
+
+# Chromium components the automation never uses; disabling them trims cold start and per-nav CPU.
+_CHROMIUM_ARGS = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-translate",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,BackForwardCache",
+)
+_CHROMIUM_IGNORE_DEFAULT_ARGS = ("--enable-automation",)
+
+_SAFE_CHARS = string.ascii_letters + string.digits + "._-"
+_UNSAFE_RUN_RE = re.compile(r"[^a-zA-Z0-9._-]+")
 
 
 def _safe_dirname(value: str) -> str:
     """Convert a string into a filesystem-safe directory name."""
     value = value.strip()
-    value = re.sub(r"[^a-zA-Z0-9._-]+", "_", value)
+    # Stripping every safe char leaves "" for the common already-safe name; skip the regex then.
+    if value.strip(_SAFE_CHARS):
+        value = _UNSAFE_RUN_RE.sub("_", value)
     return value or "default"
 
 
@@ -48,12 +82,19 @@ class BrowserSession:
 
     Notes
     -----
-    - Always launches an automation-controlled persistent profile (cookies/session persist).
+    - Always launches a persistent profile (cookies/session persist). Chrome/Edge start without
+      `--enable-automation`, so they show no "controlled by automated software" infobar.
     - Uses a user-data-dir keyed by (browser_type, username) to keep sessions separated per account.
-    - This object must be created and used on a single thread (the worker thread).
+    - This object must be created and used on a single event loop (the worker's loop).
     """
 
-    def __init__(self, browser_type: BrowserType, username: str, paths: AppPaths) -> None:
+    def __init__(
+        self,
+        browser_type: BrowserType,
+        username: str,
+        paths: AppPaths,
+        playwright: Optional[Playwright] = None,
+    ) -> None:
         """Initialize the browser session.
 
         Parameters
@@ -64,69 +105,103 @@ class BrowserSession:
             Username used to namespace the persistent profile folder.
         paths:
             App filesystem paths for persistence.
+        playwright:
+            Already-started Playwright instance to use (e.g. the pool's shared driver). It stays
+            owned by the caller; only a driver the session starts itself is stopped on `close()`.
         """
         self._browser_type = browser_type
         self._username = username
         self._paths = paths
 
         self._playwright_cm = None
-        self._playwright = None
+        self._playwright = playwright
         self._context: Optional[BrowserContext] = None
+        self._user_data_dir: Optional[Path] = None
+        self._pages_by_prefix: Dict[str, Page] = {}
 
-    def ensure_ready(self) -> None:
+    async def ensure_ready(self) -> None:
         """Ensure the persistent browser context exists."""
         if self._context is not None:
             return
 
-        self._paths.data_dir.mkdir(parents=True, exist_ok=True)
-        user_data_dir = (
-            self._paths.data_dir
-            / "browser_profiles"
-            / self._browser_type.value
-            / _safe_dirname(self._username)
-        )
-        user_data_dir.mkdir(parents=True, exist_ok=True)
+        if self._user_data_dir is None:
+            self._user_data_dir = (
+                self._paths.data_dir
+                / "browser_profiles"
+                / self._browser_type.value
+                / _safe_dirname(self._username)
+            )
+        user_data_dir = self._user_data_dir
+        if not user_data_dir.is_dir():
+            user_data_dir.mkdir(parents=True, exist_ok=True)
 
-        self._playwright_cm = sync_playwright()
-        self._playwright = self._playwright_cm.start()
+        # Imported here so Playwright's import cost lands on the first launch, not GUI startup.
+        from playwright.async_api import Error as PlaywrightError, async_playwright
+
+        if self._playwright is None:
+            self._playwright_cm = async_playwright()
+            self._playwright = await self._playwright_cm.start()
 
         if self._browser_type == BrowserType.FIREFOX:
-            self._context = self._playwright.firefox.launch_persistent_context(
+            self._context = await self._playwright.firefox.launch_persistent_context(
                 user_data_dir=str(user_data_dir),
                 headless=False,
             )
+            await self._install_request_filter()
             return
 
         channel = "chrome" if self._browser_type == BrowserType.CHROME else "msedge"
         try:
-            self._context = self._playwright.chromium.launch_persistent_context(
+            self._context = await self._playwright.chromium.launch_persistent_context(
                 user_data_dir=str(user_data_dir),
                 channel=channel,
                 headless=False,
+                args=list(_CHROMIUM_ARGS),
+                ignore_default_args=list(_CHROMIUM_IGNORE_DEFAULT_ARGS),
             )
         except PlaywrightError:
             # Fallback to bundled Chromium.
-            self._context = self._playwright.chromium.launch_persistent_context(
+            self._context = await self._playwright.chromium.launch_persistent_context(
                 user_data_dir=str(user_data_dir),
                 headless=False,
+                args=list(_CHROMIUM_ARGS),
+                ignore_default_args=list(_CHROMIUM_IGNORE_DEFAULT_ARGS),
             )
+        await self._install_request_filter()
 
-    def close(self) -> None:
-        """Close the context and stop Playwright."""
-        try:
-            if self._context is not None:
-                self._context.close()
-        finally:
-            self._context = None
-            if self._playwright_cm is not None:
-                try:
-                    self._playwright_cm.stop()
-                except Exception:
-                    pass
-                self._playwright_cm = None
-                self._playwright = None
+    async def _install_request_filter(self) -> None:
+        """Abort requests for resource types/hosts the automation never needs."""
+        assert self._context is not None, "Call ensure_ready() first."
+        if WEB_APP_CONFIG.blocked_resource_types or WEB_APP_CONFIG.blocked_hosts:
+            await self._context.route("**/*", self._filter_request)
+
+    @staticmethod
+    async def _filter_request(route: Route) -> None:
+        """Route handler: abort blocked requests, pass everything else through."""
+        request = route.request
+        if (
+            request.resource_type in WEB_APP_CONFIG.blocked_resource_types
+            or urlsplit(request.url).hostname in WEB_APP_CONFIG.blocked_hosts
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def close(self) -> None:
+        """Close the context and stop Playwright if this session started it (best-effort; never raises)."""
+        context, self._context = self._context, None
+        playwright, self._playwright = self._playwright, None
+        owns_playwright, self._playwright_cm = self._playwright_cm is not None, None
+        self._pages_by_prefix.clear()
+
+        if context is not None:
+            with suppress(Exception):
+                await context.close()
+        if playwright is not None and owns_playwright:
+            with suppress(Exception):
+                await playwright.stop()
 
-    def get_or_create_app_page(self, base_url: str, bring_to_front: bool = True) -> Page:
+    async def get_or_create_app_page(self, base_url: str, bring_to_front: bool = True) -> Page:
         """Find an existing app tab on `base_url`, or create one.
 
         Parameters
@@ -143,15 +218,151 @@ class BrowserSession:
         """
         assert self._context is not None, "Call ensure_ready() first."
 
-        for p in self._context.pages:
-            if p.url.startswith(base_url):
-                if bring_to_front:
-                    try:
-                        p.bring_to_front()
-                    except Exception:
-                        pass
-                return p
-
-        page = self._context.new_page()
-        page.goto(base_url, wait_until="domcontentloaded")
+        page = self._pages_by_prefix.get(base_url)
+        if page is None or page.is_closed() or not page.url.startswith(base_url):
+            # Cache miss: fall back to scanning tabs (the user may have opened/navigated one).
+            page = next((p for p in self._context.pages if p.url.startswith(base_url)), None)
+
+        if page is not None:
+            self._pages_by_prefix[base_url] = page
+            if bring_to_front:
+                try:
+                    await page.bring_to_front()
+                except Exception:
+                    pass
+            return page
+
+        page = await self._context.new_page()
+        # Callers wait for the specific elements they need; don't block on the full DOM here.
+        await page.goto(base_url, wait_until="commit")
+        self._pages_by_prefix[base_url] = page
         return page
+
+
+# Each pooled session is a live browser process; older accounts are closed beyond this many.
+_MAX_POOLED_SESSIONS = 3
+
+
+class BrowserSessionPool:
+    """Process-wide cache of warm `BrowserSession` objects keyed by (browser_type, username).
+
+    Notes
+    -----
+    - Keys use the casefolded username, matching how the app compares profiles.
+    - Every session runs on one shared Playwright driver, so only the first launch pays for
+      spawning it.
+    - Launched contexts stay alive so re-authenticating or switching back to a recent account
+      reuses the running browser instead of cold-starting a new one. At most
+      `_MAX_POOLED_SESSIONS` are kept; acquiring another closes the least recently used.
+    """
+
+    def __init__(self, paths: AppPaths) -> None:
+        """Create an empty pool.
+
+        Parameters
+        ----------
+        paths:
+            App filesystem paths handed to every session created by the pool.
+        """
+        self._paths = paths
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[Tuple[BrowserType, str], BrowserSession] = OrderedDict()
+        self._playwright_start: Optional[asyncio.Future] = None
+
+    async def prewarm(self) -> None:
+        """Start the shared Playwright driver ahead of time so the first launch skips it."""
+        await self._shared_playwright()
+
+    async def _shared_playwright(self) -> Optional[Playwright]:
+        """Start the shared driver once and return it.
+
+        Best-effort: on failure returns None (and retries next time), leaving the session to start
+        its own driver.
+        """
+        if self._playwright_start is None:
+            self._playwright_start = asyncio.ensure_future(self._start_playwright())
+        start = self._playwright_start
+        # Shielded so a cancelled caller doesn't cancel the start other callers are awaiting.
+        playwright = await asyncio.shield(start)
+        if playwright is None and self._playwright_start is start:
+            self._playwright_start = None
+        return playwright
+
+    @staticmethod
+    async def _start_playwright() -> Optional[Playwright]:
+        """Start a Playwright driver, or return None if that fails."""
+        try:
+            from playwright.async_api import async_playwright
+
+            return await async_playwright().start()
+        except Exception:
+            return None
+
+    def get(self, browser_type: BrowserType, username: str) -> Optional[BrowserSession]:
+        """Return the pooled session for the pair, or None if it was never acquired or has been evicted."""
+        key = (browser_type, username.casefold())
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            return session
+
+    async def acquire(self, browser_type: BrowserType, username: str) -> BrowserSession:
+        """Return a ready session for the pair, launching one on first use.
+
+        Parameters
+        ----------
+        browser_type:
+            Browser selected in the GUI.
+        username:
+            Username used to key the session and its persistent profile.
+
+        Returns
+        -------
+        BrowserSession
+            Session whose browser context is launched.
+        """
+        key = (browser_type, username.casefold())
+        evicted: list[BrowserSession] = []
+        playwright = await self._shared_playwright()
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = BrowserSession(
+                    browser_type=browser_type,
+                    username=username,
+                    paths=self._paths,
+                    playwright=playwright,
+                )
+                self._sessions[key] = session
+                while len(self._sessions) > _MAX_POOLED_SESSIONS:
+                    evicted.append(self._sessions.popitem(last=False)[1])
+            else:
+                self._sessions.move_to_end(key)
+        for old in evicted:
+            try:
+                await old.close()
+            except Exception:
+                pass
+        await session.ensure_ready()
+        return session
+
+    async def close_all(self) -> None:
+        """Close every pooled session; errors are ignored so shutdown always completes."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        start, self._playwright_start = self._playwright_start, None
+        for session in sessions:
+            try:
+                await session.close()
+            except Exception:
+                pass
+        # Sessions never stop the shared driver, so it goes last.
+        if start is not None:
+            try:
+                playwright = await start
+                if playwright is not None:
+                    await playwright.stop()
+            except Exception:
+                pass
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebAppConfig:
     """Configuration for the target web application.
 
@@ -15,10 +15,21 @@ class WebAppConfig:
         Base URL of the web application.
     login_url:
         Login endpoint URL.
+    blocked_resource_types:
+        Playwright resource types aborted in the automation browser (never scripts/XHR).
+    blocked_hosts:
+        Hostnames (e.g. analytics/ad servers) whose requests are aborted.
+
+    Notes
+    -----
+    Both blocklists are empty by default. Any entry turns on context-wide routing, which disables
+    the browser's HTTP cache and strips the blocked content from the page the admin sees.
     """
 
     base_url: str
     login_url: str
+    blocked_resource_types: frozenset[str] = frozenset()
+    blocked_hosts: frozenset[str] = frozenset()
 
 
 WEB_APP_CONFIG = WebAppConfig(
@@ -27,7 +38,7 @@ WEB_APP_CONFIG = WebAppConfig(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebSelectors:
     """CSS selectors used by automation.
 
@@ -51,7 +62,7 @@ class WebSelectors:
 SELECTORS = WebSelectors()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameConfig:
     """Configuration for the in-game console automation."""
 
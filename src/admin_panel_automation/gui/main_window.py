@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import queue
 from concurrent.futures import Future
 from typing import Optional
 
@@ -16,6 +17,9 @@ from admin_panel_automation.worker import AutomationWorker
 class AdminPanelGUI(tk.Tk):
     """Tkinter GUI containing browser selection, authentication, and action buttons."""
 
+    # How often the Tk thread drains finished worker tasks while one is pending.
+    _DRAIN_MS = 50
+
     def __init__(self) -> None:
         super().__init__()
         self.title("Admin Panel Automation")
@@ -25,6 +29,7 @@ class AdminPanelGUI(tk.Tk):
         self._paths = AppPaths.default()
         self._worker = AutomationWorker(paths=self._paths)
         self._worker.start()
+        self._worker.prewarm()
 
         self._browser_var = tk.StringVar(value=BrowserType.CHROME.value)
         self._username_var = tk.StringVar()
@@ -32,6 +37,9 @@ class AdminPanelGUI(tk.Tk):
         self._auth_status_var = tk.StringVar(value="Inactive")
 
         self._pending_future: Optional[Future] = None
+        # Filled by Future callbacks on the worker thread, drained on the Tk thread.
+        self._done_queue: queue.Queue[tuple[Future, str, BrowserType, str]] = queue.Queue()
+        self._draining = False
         self._active_browser: Optional[BrowserType] = None
         self._active_username: Optional[str] = None
 
@@ -150,7 +158,7 @@ class AdminPanelGUI(tk.Tk):
         self._lock_buttons_working()
 
         self._pending_future = self._worker.submit_auth(browser_type, username, password)
-        self.after(150, lambda: self._poll_future(kind="auth", browser_type=browser_type, username=username))
+        self._watch_future(self._pending_future, kind="auth", browser_type=browser_type, username=username)
 
     def _on_parse_clicked(self) -> None:
         """Run Parse Player List: game -> clipboard -> web submit."""
@@ -164,9 +172,8 @@ class AdminPanelGUI(tk.Tk):
         self._lock_buttons_working()
 
         self._pending_future = self._worker.submit_parse_player_list(self._active_browser, self._active_username)
-        self.after(
-            150,
-            lambda: self._poll_future(kind="parse", browser_type=self._active_browser, username=self._active_username),
+        self._watch_future(
+            self._pending_future, kind="parse", browser_type=self._active_browser, username=self._active_username
         )
 
     def _on_execute_clicked(self) -> None:
@@ -181,18 +188,35 @@ class AdminPanelGUI(tk.Tk):
         self._lock_buttons_working()
 
         self._pending_future = self._worker.submit_execute_admin_action(self._active_browser, self._active_username)
-        self.after(
-            150,
-            lambda: self._poll_future(kind="exec", browser_type=self._active_browser, username=self._active_username),
+        self._watch_future(
+            self._pending_future, kind="exec", browser_type=self._active_browser, username=self._active_username
         )
 
-    def _poll_future(self, kind: str, browser_type: BrowserType, username: str) -> None:
-        """Poll worker future and update UI when complete."""
-        fut = self._pending_future
-        if fut is None:
-            return
-        if not fut.done():
-            self.after(150, lambda: self._poll_future(kind=kind, browser_type=browser_type, username=username))
+    def _watch_future(self, fut: Future, kind: str, browser_type: BrowserType, username: str) -> None:
+        """Deliver `fut`'s completion to the Tk thread via `_done_queue`."""
+        # The callback runs on the worker thread, so it must not touch Tk: a Tk call from there can
+        # block on the main thread (e.g. while _on_close waits for shutdown) and stall the worker loop.
+        fut.add_done_callback(lambda done: self._done_queue.put((done, kind, browser_type, username)))
+        if not self._draining:
+            self._draining = True
+            self.after(self._DRAIN_MS, self._drain_done_queue)
+
+    def _drain_done_queue(self) -> None:
+        """Handle finished worker futures; keeps rescheduling itself while a task is pending."""
+        while True:
+            try:
+                item = self._done_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._handle_future_done(*item)
+        if self._pending_future is not None:
+            self.after(self._DRAIN_MS, self._drain_done_queue)
+        else:
+            self._draining = False
+
+    def _handle_future_done(self, fut: Future, kind: str, browser_type: BrowserType, username: str) -> None:
+        """Update the UI for a completed worker future."""
+        if fut is not self._pending_future:
             return
 
         self._pending_future = None
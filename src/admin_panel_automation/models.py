@@ -15,7 +15,7 @@ class BrowserType(enum.Enum):
     FIREFOX = "firefox"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthResult:
     """Outcome of an authentication attempt.
 
@@ -34,7 +34,7 @@ class AuthResult:
     detected_profile: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseResult:
     """Outcome of a Parse Player List attempt.
 
@@ -53,7 +53,7 @@ class ParseResult:
     clipboard_chars: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdminActionResult:
     """Outcome of an Execute Admin Action attempt.
 
@@ -2,21 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Optional
 
-from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
-
 from admin_panel_automation.browser.session import BrowserSession
 from admin_panel_automation.config import SELECTORS, WEB_APP_CONFIG
 from admin_panel_automation.models import AuthResult
 
+_PROFILE_RE = re.compile(r"\(([^)]+)\)")
+
+# Reads the modal body and clicks its Close button in one round trip. `SELECTORS.modal_close_visible`
+# relies on Playwright's :has-text(), so the button is matched by text in-page instead.
+_READ_AND_CLOSE_MODAL_JS = """
+(body) => {
+    const text = body.innerText.trim();
+    if (!text) return text;
+    const modal = body.closest("div.modal");
+    const close = modal && Array.from(modal.querySelectorAll("button.btn.btn-secondary"))
+        .find((b) => /close/i.test(b.textContent));
+    if (close) close.click();
+    return text;
+}
+"""
+
 
 class AuthService:
     """Implements the login check + login flow against the target web app."""
 
     _SUCCESS_TEXT = "You have been logged in."
     _FAIL_TEXT = "Please check your login credentials and try again."
+    # One scan classifies the modal: group 1 is success, group 2 is failure.
+    _OUTCOME_RE = re.compile(f"({re.escape(_SUCCESS_TEXT)})|({re.escape(_FAIL_TEXT)})")
 
     def __init__(self, session: BrowserSession) -> None:
         """Create the service.
@@ -28,7 +45,7 @@ class AuthService:
         """
         self._session = session
 
-    def authenticate(self, username: str, password: str) -> AuthResult:
+    async def authenticate(self, username: str, password: str) -> AuthResult:
         """Authenticate the persistent browser session as `username`.
 
         Parameters
@@ -43,26 +60,28 @@ class AuthService:
         AuthResult
             Outcome of the authentication attempt.
         """
-        self._session.ensure_ready()
-        page = self._session.get_or_create_app_page(WEB_APP_CONFIG.base_url)
+        wanted = username.casefold()
+        await self._session.ensure_ready()
+        page = await self._session.get_or_create_app_page(WEB_APP_CONFIG.base_url)
 
-        detected = self._try_get_profile(page)
-        if detected is not None and detected.casefold() == username.casefold():
+        detected = await self._try_get_profile(page)
+        if detected is not None and detected.casefold() == wanted:
             return AuthResult(True, "Already authenticated in this browser session.", detected)
 
-        page.goto(WEB_APP_CONFIG.login_url, wait_until="domcontentloaded")
-        page.locator(SELECTORS.login_username).fill(username)
-        page.locator(SELECTORS.login_password).fill(password)
-        page.locator(SELECTORS.login_submit).click()
+        await page.goto(WEB_APP_CONFIG.login_url, wait_until="domcontentloaded")
+        await page.locator(SELECTORS.login_username).fill(username)
+        await page.locator(SELECTORS.login_password).fill(password)
+        await page.locator(SELECTORS.login_submit).click()
 
-        modal_text = self._wait_for_modal_and_close(page)
+        modal_text = await self._wait_for_modal_and_close(page)
+        outcome = self._classify_modal(modal_text)
 
-        if self._SUCCESS_TEXT in modal_text:
-            page.goto(WEB_APP_CONFIG.base_url, wait_until="domcontentloaded")
-            detected_after = self._try_get_profile(page)
+        if outcome is True:
+            await page.goto(WEB_APP_CONFIG.base_url, wait_until="commit")
+            detected_after = await self._try_get_profile(page)
             if detected_after is None:
                 return AuthResult(False, "Login succeeded, but profile element was not found.", None)
-            if detected_after.casefold() != username.casefold():
+            if detected_after.casefold() != wanted:
                 return AuthResult(
                     False,
                     "Logged in, but detected profile does not match the requested username.",
@@ -70,39 +89,90 @@ class AuthService:
                 )
             return AuthResult(True, "Authenticated successfully.", detected_after)
 
-        if self._FAIL_TEXT in modal_text:
+        if outcome is False:
             return AuthResult(False, "Authentication failed. Verify username/password.", None)
 
         return AuthResult(False, f"Unexpected response after login: {modal_text!r}", None)
 
+    @classmethod
+    def _classify_modal(cls, text: str) -> Optional[bool]:
+        """Classify the login modal text.
+
+        Returns
+        -------
+        Optional[bool]
+            True for the success message, False for the failure message, None if neither appears.
+        """
+        m = cls._OUTCOME_RE.search(text)
+        if m is None:
+            return None
+        return m.lastindex == 1
+
     @staticmethod
     def _extract_profile(text: str) -> Optional[str]:
         """Extract profile from text like `Profile (ARTISANAL)`."""
-        m = re.search(r"\(([^)]+)\)", text)
+        i = text.find("(")
+        if i < 0:
+            return None
+        j = text.find(")", i + 1)
+        if j > i + 1:
+            return text[i + 1 : j].strip()
+        if j < 0:
+            return None
+        # Empty "()" before the real group: let the regex find the next non-empty one.
+        m = _PROFILE_RE.search(text, j)
         return m.group(1).strip() if m else None
 
-    def _try_get_profile(self, page) -> Optional[str]:
+    @staticmethod
+    async def _wait_for_profile_or_dom(page) -> None:
+        """Return once `a#profile` attaches or the DOM is parsed, whichever happens first.
+
+        Logged-in pages resolve on the anchor without waiting for DOMContentLoaded; logged-out
+        pages resolve on DOMContentLoaded instead of sitting out the selector timeout.
+        """
+        waits = {
+            asyncio.ensure_future(
+                page.wait_for_selector(SELECTORS.profile_anchor, state="attached", timeout=15_000)
+            ),
+            asyncio.ensure_future(page.wait_for_load_state("domcontentloaded", timeout=15_000)),
+        }
+        done, pending = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        # Retrieve outcomes so timeouts/cancellations are not reported as unhandled.
+        await asyncio.gather(*done, *pending, return_exceptions=True)
+
+    async def _try_get_profile(self, page) -> Optional[str]:
         """Best-effort detection of logged-in profile via `a#profile`."""
+        from playwright.async_api import Error as PlaywrightError
+
+        await self._wait_for_profile_or_dom(page)
         try:
-            loc = page.locator(SELECTORS.profile_anchor)
-            if loc.count() == 0:
-                return None
-            raw = loc.first.inner_text(timeout=1000)
-            return self._extract_profile(raw) or raw.strip()
+            # One round trip on the common logged-in path; a missing anchor times out quickly.
+            raw = await page.locator(SELECTORS.profile_anchor).first.inner_text(timeout=500)
         except PlaywrightError:
             return None
+        return self._extract_profile(raw) or raw.strip()
 
-    def _wait_for_modal_and_close(self, page) -> str:
+    async def _wait_for_modal_and_close(self, page) -> str:
         """Wait for the Bootstrap modal, read body text, click Close."""
-        body = page.locator(SELECTORS.modal_body_visible)
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         try:
-            body.wait_for(state="visible", timeout=15000)
+            # DOM insertion is enough: innerText is readable during the fade-in, and "attached"
+            # avoids Playwright's per-tick layout visibility checks.
+            body = await page.wait_for_selector(SELECTORS.modal_body_visible, state="attached", timeout=15000)
         except PlaywrightTimeoutError:
             return "No modal appeared after login."
+        if body is None:
+            return "No modal appeared after login."
 
-        text = body.first.inner_text().strip()
         try:
-            page.locator(SELECTORS.modal_close_visible).click(timeout=3000)
-        except Exception:
-            pass
+            text = await body.evaluate(_READ_AND_CLOSE_MODAL_JS)
+            if not text:
+                # Body attached before its content was rendered; give it one more tick.
+                await asyncio.sleep(0.05)
+                text = await body.evaluate(_READ_AND_CLOSE_MODAL_JS)
+        finally:
+            await body.dispose()
         return text
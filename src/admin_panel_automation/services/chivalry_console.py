@@ -5,11 +5,373 @@ from __future__ import annotations
 import os
 import time
 from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
 
 from admin_panel_automation.config import GAME_CONFIG
 
+# GAME_CONFIG is frozen: read its scalars once rather than on every command.
+_CONSOLE_VK = GAME_CONFIG.console_open_vk
+_CONSOLE_SCAN = GAME_CONFIG.console_open_scan_code
+_FOCUS_DELAY_S = GAME_CONFIG.focus_delay_s
+_CLICK_TO_FOCUS = GAME_CONFIG.click_to_focus
+_AFTER_ESCAPE_DELAY_S = GAME_CONFIG.after_escape_delay_s
+_CONSOLE_OPEN_DELAY_S = GAME_CONFIG.console_open_delay_s
+_AFTER_COMMAND_DELAY_S = GAME_CONFIG.after_command_delay_s
+_PRE_CONSOLE_ESCAPE = GAME_CONFIG.pre_console_escape
+
+_IS_WINDOWS = os.name == "nt"
+
+
+class _SendInputError(OSError):
+    """SendInput stopped early; `sent` events had already been delivered."""
+
+    def __init__(self, message: str, sent: int) -> None:
+        super().__init__(message)
+        self.sent = sent
+
+
+if _IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+    KEYEVENTF_SCANCODE = 0x0008
+    MAPVK_VK_TO_VSC = 0
+    MAPVK_VK_TO_CHAR = 2
+    VK_SHIFT = 0x10
+    VK_CAPITAL = 0x14
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    QS_ALLINPUT = 0x04FF
+    PM_REMOVE = 0x0001
+    CF_UNICODETEXT = 13
+    HWND_MESSAGE = -3
+    GMEM_MOVEABLE = 0x0002
+
+    _ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_void_p)
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", _ULONG_PTR),
+        ]
+
+    class INPUT(ctypes.Structure):
+        class _INPUT_UNION(ctypes.Union):
+            _fields_ = [("ki", KEYBDINPUT)]
+
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
+
+    # Bound once at import: building Structure types and prototypes per keypress dominated the call.
+    _USER32 = ctypes.WinDLL("user32", use_last_error=True)
+
+    _SEND_INPUT = _USER32.SendInput
+    _SEND_INPUT.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _SEND_INPUT.restype = wintypes.UINT
+
+    _MAP_VIRTUAL_KEY_EX = _USER32.MapVirtualKeyExW
+    _MAP_VIRTUAL_KEY_EX.argtypes = (wintypes.UINT, wintypes.UINT, wintypes.HKL)
+    _MAP_VIRTUAL_KEY_EX.restype = wintypes.UINT
+
+    _VK_KEY_SCAN_EX = _USER32.VkKeyScanExW
+    _VK_KEY_SCAN_EX.argtypes = (wintypes.WCHAR, wintypes.HKL)
+    _VK_KEY_SCAN_EX.restype = ctypes.c_short
+
+    _GET_KEYBOARD_LAYOUT = _USER32.GetKeyboardLayout
+    _GET_KEYBOARD_LAYOUT.argtypes = (wintypes.DWORD,)
+    _GET_KEYBOARD_LAYOUT.restype = wintypes.HKL
+
+    _GET_KEY_STATE = _USER32.GetKeyState
+    _GET_KEY_STATE.argtypes = (ctypes.c_int,)
+    _GET_KEY_STATE.restype = ctypes.c_short
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+    _ENUM_WINDOWS = _USER32.EnumWindows
+    _ENUM_WINDOWS.argtypes = (WNDENUMPROC, wintypes.LPARAM)
+    _ENUM_WINDOWS.restype = wintypes.BOOL
+
+    _IS_WINDOW = _USER32.IsWindow
+    _IS_WINDOW.argtypes = (wintypes.HWND,)
+    _IS_WINDOW.restype = wintypes.BOOL
+
+    _IS_WINDOW_VISIBLE = _USER32.IsWindowVisible
+    _IS_WINDOW_VISIBLE.argtypes = (wintypes.HWND,)
+    _IS_WINDOW_VISIBLE.restype = wintypes.BOOL
+
+    _GET_WINDOW_TEXT_LENGTH = _USER32.GetWindowTextLengthW
+    _GET_WINDOW_TEXT_LENGTH.argtypes = (wintypes.HWND,)
+    _GET_WINDOW_TEXT_LENGTH.restype = ctypes.c_int
+
+    _GET_WINDOW_TEXT = _USER32.GetWindowTextW
+    _GET_WINDOW_TEXT.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
+    _GET_WINDOW_TEXT.restype = ctypes.c_int
+
+    _GET_WINDOW_THREAD_PROCESS_ID = _USER32.GetWindowThreadProcessId
+    _GET_WINDOW_THREAD_PROCESS_ID.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+    _GET_WINDOW_THREAD_PROCESS_ID.restype = wintypes.DWORD
+
+    _GET_FOREGROUND_WINDOW = _USER32.GetForegroundWindow
+    _GET_FOREGROUND_WINDOW.argtypes = ()
+    _GET_FOREGROUND_WINDOW.restype = wintypes.HWND
+
+    _SET_FOREGROUND_WINDOW = _USER32.SetForegroundWindow
+    _SET_FOREGROUND_WINDOW.argtypes = (wintypes.HWND,)
+    _SET_FOREGROUND_WINDOW.restype = wintypes.BOOL
+
+    _SWITCH_TO_THIS_WINDOW = getattr(_USER32, "SwitchToThisWindow", None)
+    if _SWITCH_TO_THIS_WINDOW is not None:
+        _SWITCH_TO_THIS_WINDOW.argtypes = (wintypes.HWND, wintypes.BOOL)
+        _SWITCH_TO_THIS_WINDOW.restype = None
+
+    _BRING_WINDOW_TO_TOP = _USER32.BringWindowToTop
+    _BRING_WINDOW_TO_TOP.argtypes = (wintypes.HWND,)
+    _BRING_WINDOW_TO_TOP.restype = wintypes.BOOL
+
+    _SHOW_WINDOW = _USER32.ShowWindow
+    _SHOW_WINDOW.argtypes = (wintypes.HWND, ctypes.c_int)
+    _SHOW_WINDOW.restype = wintypes.BOOL
+
+    _ATTACH_THREAD_INPUT = _USER32.AttachThreadInput
+    _ATTACH_THREAD_INPUT.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.BOOL)
+    _ATTACH_THREAD_INPUT.restype = wintypes.BOOL
+
+    _GET_CLIPBOARD_SEQUENCE_NUMBER = _USER32.GetClipboardSequenceNumber
+    _GET_CLIPBOARD_SEQUENCE_NUMBER.argtypes = ()
+    _GET_CLIPBOARD_SEQUENCE_NUMBER.restype = wintypes.DWORD
+
+    _OPEN_CLIPBOARD = _USER32.OpenClipboard
+    _OPEN_CLIPBOARD.argtypes = (wintypes.HWND,)
+    _OPEN_CLIPBOARD.restype = wintypes.BOOL
+
+    _CLOSE_CLIPBOARD = _USER32.CloseClipboard
+    _CLOSE_CLIPBOARD.argtypes = ()
+    _CLOSE_CLIPBOARD.restype = wintypes.BOOL
+
+    _EMPTY_CLIPBOARD = _USER32.EmptyClipboard
+    _EMPTY_CLIPBOARD.argtypes = ()
+    _EMPTY_CLIPBOARD.restype = wintypes.BOOL
+
+    _GET_CLIPBOARD_DATA = _USER32.GetClipboardData
+    _GET_CLIPBOARD_DATA.argtypes = (wintypes.UINT,)
+    _GET_CLIPBOARD_DATA.restype = wintypes.HANDLE
+
+    _SET_CLIPBOARD_DATA = _USER32.SetClipboardData
+    _SET_CLIPBOARD_DATA.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    _SET_CLIPBOARD_DATA.restype = wintypes.HANDLE
+
+    _CREATE_WINDOW_EX = _USER32.CreateWindowExW
+    _CREATE_WINDOW_EX.argtypes = (
+        wintypes.DWORD,
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        wintypes.HWND,
+        wintypes.HMENU,
+        wintypes.HINSTANCE,
+        wintypes.LPVOID,
+    )
+    _CREATE_WINDOW_EX.restype = wintypes.HWND
+
+    _DESTROY_WINDOW = _USER32.DestroyWindow
+    _DESTROY_WINDOW.argtypes = (wintypes.HWND,)
+    _DESTROY_WINDOW.restype = wintypes.BOOL
+
+    _ADD_CLIPBOARD_FORMAT_LISTENER = _USER32.AddClipboardFormatListener
+    _ADD_CLIPBOARD_FORMAT_LISTENER.argtypes = (wintypes.HWND,)
+    _ADD_CLIPBOARD_FORMAT_LISTENER.restype = wintypes.BOOL
+
+    _REMOVE_CLIPBOARD_FORMAT_LISTENER = _USER32.RemoveClipboardFormatListener
+    _REMOVE_CLIPBOARD_FORMAT_LISTENER.argtypes = (wintypes.HWND,)
+    _REMOVE_CLIPBOARD_FORMAT_LISTENER.restype = wintypes.BOOL
+
+    _KEYBD_EVENT = _USER32.keybd_event
+    _KEYBD_EVENT.argtypes = (wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, _ULONG_PTR)
+    _KEYBD_EVENT.restype = None
+
+    WINEVENTPROC = ctypes.WINFUNCTYPE(
+        None,
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.HWND,
+        wintypes.LONG,
+        wintypes.LONG,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    )
+
+    _SET_WIN_EVENT_HOOK = _USER32.SetWinEventHook
+    _SET_WIN_EVENT_HOOK.argtypes = (
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.HMODULE,
+        WINEVENTPROC,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    )
+    _SET_WIN_EVENT_HOOK.restype = wintypes.HANDLE
+
+    _UNHOOK_WIN_EVENT = _USER32.UnhookWinEvent
+    _UNHOOK_WIN_EVENT.argtypes = (wintypes.HANDLE,)
+    _UNHOOK_WIN_EVENT.restype = wintypes.BOOL
+
+    _MSG_WAIT_FOR_MULTIPLE_OBJECTS = _USER32.MsgWaitForMultipleObjects
+    _MSG_WAIT_FOR_MULTIPLE_OBJECTS.argtypes = (
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.HANDLE),
+        wintypes.BOOL,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    )
+    _MSG_WAIT_FOR_MULTIPLE_OBJECTS.restype = wintypes.DWORD
+
+    _PEEK_MESSAGE = _USER32.PeekMessageW
+    _PEEK_MESSAGE.argtypes = (
+        ctypes.POINTER(wintypes.MSG),
+        wintypes.HWND,
+        wintypes.UINT,
+        wintypes.UINT,
+        wintypes.UINT,
+    )
+    _PEEK_MESSAGE.restype = wintypes.BOOL
+
+    _TRANSLATE_MESSAGE = _USER32.TranslateMessage
+    _TRANSLATE_MESSAGE.argtypes = (ctypes.POINTER(wintypes.MSG),)
+    _TRANSLATE_MESSAGE.restype = wintypes.BOOL
+
+    _DISPATCH_MESSAGE = _USER32.DispatchMessageW
+    _DISPATCH_MESSAGE.argtypes = (ctypes.POINTER(wintypes.MSG),)
+    _DISPATCH_MESSAGE.restype = wintypes.LPARAM
+
+    # The hook only has to wake the waiting thread's message queue; the foreground is re-read
+    # afterwards. Kept at module level so the callback thunk is never garbage collected.
+    _FOREGROUND_EVENT_PROC = WINEVENTPROC(lambda *_args: None)
+
+    _KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _GET_CURRENT_THREAD_ID = _KERNEL32.GetCurrentThreadId
+    _GET_CURRENT_THREAD_ID.argtypes = ()
+    _GET_CURRENT_THREAD_ID.restype = wintypes.DWORD
+
+    _GLOBAL_ALLOC = _KERNEL32.GlobalAlloc
+    _GLOBAL_ALLOC.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    _GLOBAL_ALLOC.restype = wintypes.HGLOBAL
+
+    _GLOBAL_FREE = _KERNEL32.GlobalFree
+    _GLOBAL_FREE.argtypes = (wintypes.HGLOBAL,)
+    _GLOBAL_FREE.restype = wintypes.HGLOBAL
+
+    _GLOBAL_LOCK = _KERNEL32.GlobalLock
+    _GLOBAL_LOCK.argtypes = (wintypes.HGLOBAL,)
+    _GLOBAL_LOCK.restype = ctypes.c_void_p
+
+    _GLOBAL_UNLOCK = _KERNEL32.GlobalUnlock
+    _GLOBAL_UNLOCK.argtypes = (wintypes.HGLOBAL,)
+    _GLOBAL_UNLOCK.restype = wintypes.BOOL
+
+    _INPUT_SIZE = ctypes.sizeof(INPUT)
+
+    # Upper bound per SendInput call; longer sequences are sent as consecutive batches, in order.
+    _MAX_INPUTS_PER_SEND = 1000
+
+    def _send_inputs(inputs: ctypes.Array, what: str) -> int:
+        """Send a filled INPUT array, at most `_MAX_INPUTS_PER_SEND` events per SendInput call.
+
+        Returns
+        -------
+        int
+            Number of events inserted (always the full array length).
 
-@dataclass(frozen=True)
+        Raises
+        ------
+        _SendInputError
+            If SendInput does not accept every event; `sent` says how many got through.
+        """
+        total = len(inputs)
+        for start in range(0, total, _MAX_INPUTS_PER_SEND):
+            count = min(_MAX_INPUTS_PER_SEND, total - start)
+            chunk = inputs if count == total else (INPUT * count).from_buffer(inputs, start * _INPUT_SIZE)
+            sent = _SEND_INPUT(count, chunk, _INPUT_SIZE)
+            if sent != count:
+                err = ctypes.get_last_error()
+                raise _SendInputError(
+                    f"Failed to send {what} (SendInput sent {start + sent}/{total}, err={err}).", start + sent
+                )
+        return total
+
+    def _send_keybd_inputs(events: Sequence[tuple[int, int]], what: str = "input") -> int:
+        """Build one INPUT array from `(wScan, dwFlags)` keyboard events and send it.
+
+        Returns
+        -------
+        int
+            Number of events inserted.
+
+        Raises
+        ------
+        OSError
+            If SendInput does not accept every event.
+        """
+        inputs = (INPUT * len(events))()
+        for slot, (scan, flags) in zip(inputs, events):
+            slot.type = INPUT_KEYBOARD
+            slot.ki.wScan = scan
+            slot.ki.dwFlags = flags
+        return _send_inputs(inputs, what)
+
+    def _foreground_layout() -> int:
+        """Return the keyboard layout of the foreground window's thread, where injected keys land.
+
+        It need not match the calling thread's layout, which is what plain MapVirtualKeyW uses.
+        """
+        return _GET_KEYBOARD_LAYOUT(_GET_WINDOW_THREAD_PROCESS_ID(_GET_FOREGROUND_WINDOW(), None)) or 0
+
+    # (layout, VK) -> scan code. Unmapped keys (0) are not cached.
+    _SCAN_CACHE: dict[tuple[int, int], int] = {}
+
+    def _vk_to_scan(vk_code: int) -> int:
+        """Return the scan code for `vk_code` on the foreground layout, or 0 if it has none."""
+        hkl = _foreground_layout()
+        scan = _SCAN_CACHE.get((hkl, vk_code))
+        if scan is None:
+            scan = _MAP_VIRTUAL_KEY_EX(vk_code, MAPVK_VK_TO_VSC, hkl)
+            if scan:
+                _SCAN_CACHE[hkl, vk_code] = scan
+        return scan
+
+    # Scan code -> prebuilt down/up INPUT pair. SendInput only reads the array, so pairs are reused.
+    _SCAN_PAIRS: dict[int, ctypes.Array] = {}
+
+    def _scan_pair(scan_code: int) -> ctypes.Array:
+        """Return the cached down/up INPUT pair for `scan_code`."""
+        pair = _SCAN_PAIRS.get(scan_code)
+        if pair is None:
+            pair = (INPUT * 2)()
+            for slot, flags in zip(pair, (KEYEVENTF_SCANCODE, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP)):
+                slot.type = INPUT_KEYBOARD
+                slot.ki.wScan = scan_code
+                slot.ki.dwFlags = flags
+            _SCAN_PAIRS[scan_code] = pair
+        return pair
+
+    # Escape, Enter and the configured console scan code are the same on every layout.
+    for _scan in (0x01, 0x1C, _CONSOLE_SCAN):
+        _scan_pair(_scan)
+    del _scan
+
+
+@dataclass(frozen=True, slots=True)
 class ChivalryWindowMatch:
     """Window matching configuration for locating Chivalry 2."""
 
@@ -21,484 +383,519 @@ class ChivalryConsoleAutomation:
     """Automation for focusing Chivalry 2 and issuing console commands (Windows only)."""
 
     _match = ChivalryWindowMatch()
+    # The match config is frozen, so its casefolded forms are computed once here.
+    _CONTAINS_CF = _match.title_contains.casefold()
+    _PREFERRED_CF = _match.title_exact_preferred.casefold()
+    # Last exact-title match; the game window is stable for the lifetime of a game session.
+    _cached_hwnd: Optional[int] = None
+    _cached_title: str = ""
+    # Index of the key-delivery fallback that last worked for Enter / opening the console.
+    _enter_strategy: int = 0
+    _console_strategy: int = 0
 
     @staticmethod
     def _press_vk_keybd_event(vk_code: int) -> None:
         """Press and release a Windows virtual-key code via keybd_event (fallback)."""
-        import ctypes
-        from ctypes import wintypes
-
-        ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_void_p)
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
-        map_virtual_key = user32.MapVirtualKeyW
-        map_virtual_key.argtypes = (wintypes.UINT, wintypes.UINT)
-        map_virtual_key.restype = wintypes.UINT
+        scan = _vk_to_scan(vk_code) & 0xFF
+        ctypes.set_last_error(0)
+        _KEYBD_EVENT(vk_code & 0xFF, scan, 0, 0)
+        _KEYBD_EVENT(vk_code & 0xFF, scan, KEYEVENTF_KEYUP, 0)
 
-        keybd_event = user32.keybd_event
-        keybd_event.argtypes = (wintypes.BYTE, wintypes.BYTE, wintypes.DWORD, ULONG_PTR)
-        keybd_event.restype = None
+    @classmethod
+    def _send_paste_and_enter(cls) -> int:
+        """Send Ctrl+V followed by Enter as one SendInput batch."""
+        ctrl, v, enter = _vk_to_scan(0x11), _vk_to_scan(0x56), _vk_to_scan(0x0D)
+        if not ctrl or not v or not enter:
+            raise OSError("MapVirtualKeyExW failed for Ctrl+V/Enter.")
 
-        scan = map_virtual_key(vk_code, 0) & 0xFF
-        ctypes.set_last_error(0)
-        keybd_event(vk_code & 0xFF, scan, 0, 0)
-        keybd_event(vk_code & 0xFF, scan, 0x0002, 0)  # KEYEVENTF_KEYUP
+        down, up = KEYEVENTF_SCANCODE, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP
+        return _send_keybd_inputs(((ctrl, down), (v, down), (v, up), (ctrl, up), (enter, down), (enter, up)))
 
     @staticmethod
-    def _send_vk_chord(vk_modifier: int, vk_key: int) -> None:
+    def _send_vk_chord(vk_modifier: int, vk_key: int) -> int:
         """Send a chord like Ctrl+V via SendInput (down/up events)."""
-        import ctypes
-        from ctypes import wintypes
-
-        ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_void_p)
-
-        INPUT_KEYBOARD = 1
-        KEYEVENTF_KEYUP = 0x0002
-        KEYEVENTF_SCANCODE = 0x0008
-        MAPVK_VK_TO_VSC = 0
-
-        class KEYBDINPUT(ctypes.Structure):
-            _fields_ = [
-                ("wVk", wintypes.WORD),
-                ("wScan", wintypes.WORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ULONG_PTR),
-            ]
-
-        class INPUT(ctypes.Structure):
-            class _INPUT_UNION(ctypes.Union):
-                _fields_ = [("ki", KEYBDINPUT)]
-
-            _anonymous_ = ("u",)
-            _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
-        send_input = user32.SendInput
-        send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
-        send_input.restype = wintypes.UINT
-
-        map_virtual_key = user32.MapVirtualKeyW
-        map_virtual_key.argtypes = (wintypes.UINT, wintypes.UINT)
-        map_virtual_key.restype = wintypes.UINT
-
-        mod_scan = map_virtual_key(vk_modifier, MAPVK_VK_TO_VSC)
-        key_scan = map_virtual_key(vk_key, MAPVK_VK_TO_VSC)
+        mod_scan = _vk_to_scan(vk_modifier)
+        key_scan = _vk_to_scan(vk_key)
         if not mod_scan or not key_scan:
-            raise OSError("MapVirtualKeyW failed for modifier/key chord.")
-
-        events = (INPUT * 4)(
-            INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=0, wScan=mod_scan, dwFlags=KEYEVENTF_SCANCODE, time=0, dwExtraInfo=0)),
-            INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=0, wScan=key_scan, dwFlags=KEYEVENTF_SCANCODE, time=0, dwExtraInfo=0)),
-            INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=0, wScan=key_scan, dwFlags=KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, time=0, dwExtraInfo=0)),
-            INPUT(type=INPUT_KEYBOARD, ki=KEYBDINPUT(wVk=0, wScan=mod_scan, dwFlags=KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP, time=0, dwExtraInfo=0)),
-        )
+            raise OSError("MapVirtualKeyExW failed for modifier/key chord.")
 
-        sent = send_input(4, events, ctypes.sizeof(INPUT))
-        if sent != 4:
-            err = ctypes.get_last_error()
-            raise OSError(f"Failed to send chord (SendInput sent {sent}/4, err={err}).")
+        down, up = KEYEVENTF_SCANCODE, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP
+        return _send_keybd_inputs(((mod_scan, down), (key_scan, down), (key_scan, up), (mod_scan, up)), "chord")
 
     @staticmethod
-    def _press_virtual_key(vk_code: int) -> None:
+    def _press_virtual_key(vk_code: int) -> int:
         """Press and release a Windows virtual-key code."""
-        import ctypes
-        from ctypes import wintypes
-
-        ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_void_p)
-
-        INPUT_KEYBOARD = 1
-        KEYEVENTF_KEYUP = 0x0002
-        KEYEVENTF_SCANCODE = 0x0008
-        MAPVK_VK_TO_VSC = 0
-
-        class KEYBDINPUT(ctypes.Structure):
-            _fields_ = [
-                ("wVk", wintypes.WORD),
-                ("wScan", wintypes.WORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ULONG_PTR),
-            ]
-
-        class INPUT(ctypes.Structure):
-            class _INPUT_UNION(ctypes.Union):
-                _fields_ = [("ki", KEYBDINPUT)]
-
-            _anonymous_ = ("u",)
-            _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
-
-        send_input = user32.SendInput
-        send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
-        send_input.restype = wintypes.UINT
-
-        map_virtual_key = user32.MapVirtualKeyW
-        map_virtual_key.argtypes = (wintypes.UINT, wintypes.UINT)
-        map_virtual_key.restype = wintypes.UINT
-
-        scan_code = map_virtual_key(vk_code, MAPVK_VK_TO_VSC)
+        scan_code = _vk_to_scan(vk_code)
         if not scan_code:
-            raise OSError(f"MapVirtualKeyW failed for VK 0x{vk_code:02X}.")
+            raise OSError(f"MapVirtualKeyExW failed for VK 0x{vk_code:02X}.")
 
-        inputs = (INPUT * 2)(
-            INPUT(
-                type=INPUT_KEYBOARD,
-                ki=KEYBDINPUT(wVk=0, wScan=scan_code, dwFlags=KEYEVENTF_SCANCODE, time=0, dwExtraInfo=0),
-            ),
-            INPUT(
-                type=INPUT_KEYBOARD,
-                ki=KEYBDINPUT(
-                    wVk=0,
-                    wScan=scan_code,
-                    dwFlags=KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP,
-                    time=0,
-                    dwExtraInfo=0,
-                ),
-            ),
-        )
-
-        sent = send_input(2, inputs, ctypes.sizeof(INPUT))
+        sent = _SEND_INPUT(2, _scan_pair(scan_code), _INPUT_SIZE)
         if sent != 2:
             err = ctypes.get_last_error()
             raise OSError(f"Failed to send VK 0x{vk_code:02X} (SendInput sent {sent}/2, err={err}).")
+        return sent
 
     @staticmethod
-    def _press_scan_code(scan_code: int) -> None:
-        """Press and release a keyboard scan code (layout-independent)."""
-        import ctypes
-        from ctypes import wintypes
-
-        ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_void_p)
-
-        INPUT_KEYBOARD = 1
-        KEYEVENTF_KEYUP = 0x0002
-        KEYEVENTF_SCANCODE = 0x0008
-
-        class KEYBDINPUT(ctypes.Structure):
-            _fields_ = [
-                ("wVk", wintypes.WORD),
-                ("wScan", wintypes.WORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ULONG_PTR),
-            ]
+    def _send_scan_string(text: str) -> int:
+        """Type `text` as physical key presses using a single SendInput call.
 
-        class INPUT(ctypes.Structure):
-            class _INPUT_UNION(ctypes.Union):
-                _fields_ = [("ki", KEYBDINPUT)]
-
-            _anonymous_ = ("u",)
-            _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        Characters are mapped through the foreground (game) window's keyboard layout, wrapping
+        them in Shift when required. Characters that need Ctrl/Alt, have no key on the layout or
+        sit on a dead key are sent as Unicode events in the same batch, as are letters while Caps
+        Lock is on (it would invert their case).
+        """
+        if not text:
+            return 0
 
-        send_input = user32.SendInput
-        send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
-        send_input.restype = wintypes.UINT
+        hkl = _foreground_layout()
+        caps_lock = bool(_GET_KEY_STATE(VK_CAPITAL) & 1)
+        shift_scan = _vk_to_scan(VK_SHIFT)
+        events: list[tuple[int, int]] = []  # (wScan, dwFlags)
+        for ch in text:
+            key = _VK_KEY_SCAN_EX(ch, hkl) if ord(ch) <= 0xFFFF else -1
+            mods = (key >> 8) & 0xFF if key != -1 else 0
+            scan = 0
+            if key != -1 and mods in (0, 1) and not (caps_lock and ch.isalpha()):
+                vk = key & 0xFF
+                # The high bit of the VK_TO_CHAR mapping flags a dead key, which would swallow
+                # the next character instead of typing this one.
+                if not _MAP_VIRTUAL_KEY_EX(vk, MAPVK_VK_TO_CHAR, hkl) & 0x80000000:
+                    scan = _MAP_VIRTUAL_KEY_EX(vk, MAPVK_VK_TO_VSC, hkl)
+            if not scan:
+                for unit in memoryview(ch.encode("utf-16-le")).cast("H"):
+                    events.append((unit, KEYEVENTF_UNICODE))
+                    events.append((unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+                continue
+            if mods:
+                events.append((shift_scan, KEYEVENTF_SCANCODE))
+            events.append((scan, KEYEVENTF_SCANCODE))
+            events.append((scan, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP))
+            if mods:
+                events.append((shift_scan, KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP))
 
-        inputs = (INPUT * 2)(
-            INPUT(
-                type=INPUT_KEYBOARD,
-                ki=KEYBDINPUT(wVk=0, wScan=scan_code, dwFlags=KEYEVENTF_SCANCODE, time=0, dwExtraInfo=0),
-            ),
-            INPUT(
-                type=INPUT_KEYBOARD,
-                ki=KEYBDINPUT(
-                    wVk=0,
-                    wScan=scan_code,
-                    dwFlags=KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP,
-                    time=0,
-                    dwExtraInfo=0,
-                ),
-            ),
-        )
+        return _send_keybd_inputs(events, "text")
 
-        sent = send_input(2, inputs, ctypes.sizeof(INPUT))
+    @staticmethod
+    def _press_scan_code(scan_code: int) -> int:
+        """Press and release a keyboard scan code (layout-independent)."""
+        sent = _SEND_INPUT(2, _scan_pair(scan_code), _INPUT_SIZE)
         if sent != 2:
             err = ctypes.get_last_error()
             raise OSError(
                 f"Failed to send scan code 0x{scan_code:02X} (SendInput sent {sent}/2, err={err})."
             )
+        return sent
 
     @staticmethod
-    def _send_text_unicode(text: str) -> None:
+    def _send_text_unicode(text: str) -> int:
         """Send text as Unicode keystrokes to the active foreground window."""
-        import ctypes
-        from ctypes import wintypes
-
-        ULONG_PTR = getattr(wintypes, "ULONG_PTR", ctypes.c_void_p)
-
-        INPUT_KEYBOARD = 1
-        KEYEVENTF_KEYUP = 0x0002
-        KEYEVENTF_UNICODE = 0x0004
-
-        class KEYBDINPUT(ctypes.Structure):
-            _fields_ = [
-                ("wVk", wintypes.WORD),
-                ("wScan", wintypes.WORD),
-                ("dwFlags", wintypes.DWORD),
-                ("time", wintypes.DWORD),
-                ("dwExtraInfo", ULONG_PTR),
-            ]
-
-        class INPUT(ctypes.Structure):
-            class _INPUT_UNION(ctypes.Union):
-                _fields_ = [("ki", KEYBDINPUT)]
-
-            _anonymous_ = ("u",)
-            _fields_ = [("type", wintypes.DWORD), ("u", _INPUT_UNION)]
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
-
-        send_input = user32.SendInput
-        send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
-        send_input.restype = wintypes.UINT
-
-        inputs = []
-        for ch in text:
-            code = ord(ch)
-            inputs.append(
-                INPUT(
-                    type=INPUT_KEYBOARD,
-                    ki=KEYBDINPUT(wVk=0, wScan=code, dwFlags=KEYEVENTF_UNICODE, time=0, dwExtraInfo=0),
-                )
-            )
-            inputs.append(
-                INPUT(
-                    type=INPUT_KEYBOARD,
-                    ki=KEYBDINPUT(
-                        wVk=0,
-                        wScan=code,
-                        dwFlags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP,
-                        time=0,
-                        dwExtraInfo=0,
-                    ),
-                )
-            )
+        if not text:
+            return 0
 
-        if not inputs:
-            return
+        units = memoryview(text.encode("utf-16-le")).cast("H")
+        inputs = (INPUT * (2 * len(units)))()
+        for i, unit in enumerate(units):
+            down, up = inputs[2 * i], inputs[2 * i + 1]
+            down.type = up.type = INPUT_KEYBOARD
+            down.ki.wScan = up.ki.wScan = unit
+            down.ki.dwFlags = KEYEVENTF_UNICODE
+            up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
 
-        arr = (INPUT * len(inputs))(*inputs)
-        sent = send_input(len(arr), arr, ctypes.sizeof(INPUT))
-        if sent != len(arr):
-            err = ctypes.get_last_error()
-            raise OSError(f"Failed to send Unicode text (SendInput sent {sent}/{len(arr)}, err={err}).")
+        return _send_inputs(inputs, "Unicode text")
 
     @staticmethod
     def _get_foreground_window_handle() -> int:
-        import ctypes
-        from ctypes import wintypes
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
-        get_foreground = user32.GetForegroundWindow
-        get_foreground.argtypes = ()
-        get_foreground.restype = wintypes.HWND
-        hwnd = get_foreground()
+        hwnd = _GET_FOREGROUND_WINDOW()
         return int(hwnd) if hwnd else 0
 
     @staticmethod
     def _get_window_text(hwnd: int) -> str:
-        import ctypes
-        from ctypes import wintypes
-
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
-        get_len = user32.GetWindowTextLengthW
-        get_len.argtypes = (wintypes.HWND,)
-        get_len.restype = ctypes.c_int
-
-        get_text = user32.GetWindowTextW
-        get_text.argtypes = (wintypes.HWND, wintypes.LPWSTR, ctypes.c_int)
-        get_text.restype = ctypes.c_int
-
-        handle = wintypes.HWND(hwnd)
-        length = int(get_len(handle))
+        length = int(_GET_WINDOW_TEXT_LENGTH(hwnd))
         buf = ctypes.create_unicode_buffer(max(length + 1, 512))
-        get_text(handle, buf, len(buf))
+        _GET_WINDOW_TEXT(hwnd, buf, len(buf))
         return buf.value
 
     @classmethod
     def _wait_for_foreground(cls, hwnd: int, timeout_s: float = 1.5) -> bool:
-        deadline = time.time() + timeout_s
-        while time.time() < deadline:
-            if cls._get_foreground_window_handle() == hwnd:
-                return True
-            time.sleep(0.05)
-        return False
+        """Wait up to `timeout_s` for `hwnd` to become the foreground window.
+
+        An EVENT_SYSTEM_FOREGROUND hook wakes the wait as soon as the foreground changes. Each
+        wait is still capped at 50 ms, which is the old polling interval, so a missed wake-up
+        costs no more than polling did. If the hook can't be installed, this falls back to
+        plain polling.
+        """
+        if cls._get_foreground_window_handle() == hwnd:
+            return True
+
+        deadline = time.monotonic() + timeout_s
+        hook = _SET_WIN_EVENT_HOOK(
+            EVENT_SYSTEM_FOREGROUND,
+            EVENT_SYSTEM_FOREGROUND,
+            None,
+            _FOREGROUND_EVENT_PROC,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT,
+        )
+        msg = wintypes.MSG()
+        try:
+            while True:
+                if cls._get_foreground_window_handle() == hwnd:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if not hook:
+                    time.sleep(min(0.05, remaining))
+                    continue
+                _MSG_WAIT_FOR_MULTIPLE_OBJECTS(0, None, False, int(min(0.05, remaining) * 1000), QS_ALLINPUT)
+                # Out-of-context WinEvents are delivered while this thread retrieves messages.
+                cls._pump_messages(msg)
+        finally:
+            if hook:
+                _UNHOOK_WIN_EVENT(hook)
 
     @staticmethod
     def _force_foreground_window(hwnd: int) -> None:
         """Best-effort: force `hwnd` to foreground without mouse clicks."""
-        import ctypes
-        from ctypes import wintypes
+        SW_RESTORE = 9
 
-        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        _SHOW_WINDOW(hwnd, SW_RESTORE)
+        _BRING_WINDOW_TO_TOP(hwnd)
 
-        get_foreground = user32.GetForegroundWindow
-        get_foreground.argtypes = ()
-        get_foreground.restype = wintypes.HWND
+        fg = _GET_FOREGROUND_WINDOW()
+        fg_tid = int(_GET_WINDOW_THREAD_PROCESS_ID(fg, None)) if fg else 0
+        target_tid = int(_GET_WINDOW_THREAD_PROCESS_ID(hwnd, None))
+        cur_tid = _GET_CURRENT_THREAD_ID()
 
-        get_window_thread = user32.GetWindowThreadProcessId
-        get_window_thread.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
-        get_window_thread.restype = wintypes.DWORD
+        attached_1 = attached_2 = False
+        try:
+            if fg_tid and fg_tid != cur_tid:
+                attached_1 = bool(_ATTACH_THREAD_INPUT(fg_tid, cur_tid, True))
+            if target_tid and target_tid != cur_tid:
+                attached_2 = bool(_ATTACH_THREAD_INPUT(target_tid, cur_tid, True))
+            ok = bool(_SET_FOREGROUND_WINDOW(hwnd))
+            if not ok and _SWITCH_TO_THIS_WINDOW is not None:
+                _SWITCH_TO_THIS_WINDOW(hwnd, True)
+        finally:
+            if attached_2:
+                _ATTACH_THREAD_INPUT(target_tid, cur_tid, False)
+            if attached_1:
+                _ATTACH_THREAD_INPUT(fg_tid, cur_tid, False)
 
-        attach_thread_input = user32.AttachThreadInput
-        attach_thread_input.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.BOOL)
-        attach_thread_input.restype = wintypes.BOOL
+    @staticmethod
+    def _send_keys(keys: str) -> None:
+        """Send `keys` through pywinauto's send_keys (last-resort fallback)."""
+        from pywinauto.keyboard import send_keys
+
+        send_keys(keys, pause=0.02)
+
+    @staticmethod
+    def _run_fallbacks(
+        strategies: Sequence[tuple[Callable[[Any], None], Any]], preferred: int, what: str
+    ) -> int:
+        """Call `(func, arg)` strategies until one succeeds, starting with index `preferred`.
 
-        set_foreground = user32.SetForegroundWindow
-        set_foreground.argtypes = (wintypes.HWND,)
-        set_foreground.restype = wintypes.BOOL
+        Returns
+        -------
+        int
+            Index of the strategy that succeeded.
+
+        Raises
+        ------
+        RuntimeError
+            If every strategy raised.
+        """
+        errors: list[Exception] = []
+        for i in (preferred, *(j for j in range(len(strategies)) if j != preferred)):
+            func, arg = strategies[i]
+            try:
+                func(arg)
+                return i
+            except Exception as e:
+                errors.append(e)
 
-        switch_to = getattr(user32, "SwitchToThisWindow", None)
-        if switch_to is not None:
-            switch_to.argtypes = (wintypes.HWND, wintypes.BOOL)
-            switch_to.restype = None
+        msg = "; ".join(str(e) for e in errors if str(e))
+        raise RuntimeError(f"Failed to {what}. {msg}") from errors[0]
 
-        bring_to_top = user32.BringWindowToTop
-        bring_to_top.argtypes = (wintypes.HWND,)
-        bring_to_top.restype = wintypes.BOOL
+    @classmethod
+    def _press_enter(cls) -> None:
+        """Press Enter with multiple fallbacks (some environments block SendInput for VK_RETURN).
 
-        show_window = user32.ShowWindow
-        show_window.argtypes = (wintypes.HWND, ctypes.c_int)
-        show_window.restype = wintypes.BOOL
+        The strategy that worked last time is tried first on later calls.
+        """
+        cls._enter_strategy = cls._run_fallbacks(
+            (
+                (cls._press_virtual_key, 0x0D),  # VK_RETURN
+                (cls._press_scan_code, 0x1C),  # ENTER
+                (cls._press_vk_keybd_event, 0x0D),  # VK_RETURN
+                (cls._send_keys, "{ENTER}"),
+            ),
+            cls._enter_strategy,
+            "press Enter",
+        )
 
-        get_current_thread = user32.GetCurrentThreadId
-        get_current_thread.argtypes = ()
-        get_current_thread.restype = wintypes.DWORD
+    @staticmethod
+    def clipboard_sequence_number() -> int:
+        """Return the system clipboard sequence number, which changes on every clipboard write.
 
-        SW_RESTORE = 9
+        Reading it does not open the clipboard or copy its contents, so it is cheap to poll.
+        """
+        return int(_GET_CLIPBOARD_SEQUENCE_NUMBER())
 
-        target = wintypes.HWND(hwnd)
-        show_window(target, SW_RESTORE)
-        bring_to_top(target)
+    @staticmethod
+    def _pump_messages(msg: wintypes.MSG) -> None:
+        """Dispatch everything queued for the calling thread (delivers hook/listener callbacks)."""
+        while _PEEK_MESSAGE(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+            _TRANSLATE_MESSAGE(ctypes.byref(msg))
+            _DISPATCH_MESSAGE(ctypes.byref(msg))
 
-        fg = get_foreground()
-        fg_tid = 0
-        if fg:
-            fg_pid = wintypes.DWORD()
-            fg_tid = int(get_window_thread(fg, ctypes.byref(fg_pid)))
+    @classmethod
+    def wait_for_clipboard_change(cls, since_seq: int, timeout_s: float) -> int:
+        """Block until the clipboard sequence number differs from `since_seq`, or `timeout_s` passes.
 
-        target_pid = wintypes.DWORD()
-        target_tid = int(get_window_thread(target, ctypes.byref(target_pid)))
-        cur_tid = get_current_thread()
+        A message-only window registered with AddClipboardFormatListener wakes the wait as soon
+        as anything writes to the clipboard. If the listener can't be created, this falls back to
+        polling the sequence number with exponential backoff.
 
-        attached_1 = attached_2 = False
+        Parameters
+        ----------
+        since_seq:
+            Sequence number the caller has already seen.
+        timeout_s:
+            Maximum time to wait.
+
+        Returns
+        -------
+        int
+            The current sequence number (equal to `since_seq` on timeout).
+        """
+        deadline = time.monotonic() + timeout_s
+        hwnd = cls._create_message_window()
+        listening = bool(hwnd) and bool(_ADD_CLIPBOARD_FORMAT_LISTENER(hwnd))
+        msg = wintypes.MSG()
+        poll_s = 0.005
         try:
-            if fg_tid and fg_tid != cur_tid:
-                attached_1 = bool(attach_thread_input(fg_tid, cur_tid, True))
-            if target_tid and target_tid != cur_tid:
-                attached_2 = bool(attach_thread_input(target_tid, cur_tid, True))
-            ok = bool(set_foreground(target))
-            if not ok and switch_to is not None:
-                switch_to(target, True)
+            while True:
+                seq = cls.clipboard_sequence_number()
+                remaining = deadline - time.monotonic()
+                if seq != since_seq or remaining <= 0:
+                    return seq
+                if not listening:
+                    # Back off from 5 ms to 100 ms: quick writes are caught fast, slow ones poll rarely.
+                    time.sleep(min(poll_s, remaining))
+                    poll_s = min(0.1, poll_s * 1.5)
+                    continue
+                # WM_CLIPBOARDUPDATE is sent to the listener window, which wakes this wait; the
+                # sequence number is re-read after pumping. The cap only guards against a missed wake.
+                _MSG_WAIT_FOR_MULTIPLE_OBJECTS(0, None, False, int(min(0.25, remaining) * 1000), QS_ALLINPUT)
+                cls._pump_messages(msg)
         finally:
-            if attached_2:
-                attach_thread_input(target_tid, cur_tid, False)
-            if attached_1:
-                attach_thread_input(fg_tid, cur_tid, False)
+            if listening:
+                _REMOVE_CLIPBOARD_FORMAT_LISTENER(hwnd)
+            if hwnd:
+                _DESTROY_WINDOW(hwnd)
+
+    @staticmethod
+    def _create_message_window() -> Optional[int]:
+        """Create a hidden message-only window (clipboard listener/owner); None if that fails."""
+        return _CREATE_WINDOW_EX(0, "STATIC", None, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None) or None
+
+    @staticmethod
+    def _open_clipboard(owner: Optional[int] = None, attempts: int = 5) -> bool:
+        """Open the clipboard for `owner`, retrying briefly while another process holds it."""
+        for _ in range(attempts):
+            if _OPEN_CLIPBOARD(owner):
+                return True
+            time.sleep(0.01)
+        return False
 
     @classmethod
-    def _press_enter(cls) -> None:
-        """Press Enter with multiple fallbacks (some environments block SendInput for VK_RETURN)."""
-        errors: list[Exception] = []
-        try:
-            cls._press_virtual_key(0x0D)  # VK_RETURN
-            return
-        except Exception as e:
-            errors.append(e)
+    def get_clipboard_text(cls) -> str:
+        """Return the clipboard's Unicode text, or "" if it holds none.
 
-        try:
-            cls._press_scan_code(0x1C)  # ENTER
-            return
-        except Exception as e:
-            errors.append(e)
+        Uses the Win32 clipboard API directly; falls back to pyperclip if the clipboard stays
+        locked by another process.
+        """
+        if not cls._open_clipboard():
+            import pyperclip
 
+            return pyperclip.paste() or ""
         try:
-            cls._press_vk_keybd_event(0x0D)  # VK_RETURN
-            return
-        except Exception as e:
-            errors.append(e)
+            handle = _GET_CLIPBOARD_DATA(CF_UNICODETEXT)
+            if not handle:
+                return ""
+            ptr = _GLOBAL_LOCK(handle)
+            if not ptr:
+                return ""
+            try:
+                return ctypes.wstring_at(ptr)
+            finally:
+                _GLOBAL_UNLOCK(handle)
+        finally:
+            _CLOSE_CLIPBOARD()
 
-        try:
-            from pywinauto.keyboard import send_keys
+    @classmethod
+    def set_clipboard_text(cls, text: str) -> None:
+        """Replace the clipboard contents with `text`.
 
-            send_keys("{ENTER}", pause=0.02)
-            return
-        except Exception as e:
-            errors.append(e)
+        Uses the Win32 clipboard API directly; falls back to pyperclip if the clipboard stays
+        locked by another process or no owner window can be created.
 
-        msg = "; ".join(str(e) for e in errors if str(e))
-        raise RuntimeError(f"Failed to press Enter. {msg}") from errors[0]
+        Raises
+        ------
+        OSError
+            If the clipboard memory cannot be allocated or handed to the clipboard.
+        """
+        # SetClipboardData fails after EmptyClipboard if the clipboard was opened with a NULL
+        # owner, so open it for a throwaway message-only window (as pyperclip does).
+        owner = cls._create_message_window()
+        if not owner or not cls._open_clipboard(owner):
+            if owner:
+                _DESTROY_WINDOW(owner)
+            import pyperclip
+
+            pyperclip.copy(text)
+            return
+        try:
+            data = text.encode("utf-16-le") + b"\x00\x00"
+            handle = _GLOBAL_ALLOC(GMEM_MOVEABLE, len(data))
+            if not handle:
+                raise OSError(f"GlobalAlloc failed (err={ctypes.get_last_error()}).")
+            ptr = _GLOBAL_LOCK(handle)
+            if not ptr:
+                _GLOBAL_FREE(handle)
+                raise OSError(f"GlobalLock failed (err={ctypes.get_last_error()}).")
+            ctypes.memmove(ptr, data, len(data))
+            _GLOBAL_UNLOCK(handle)
+
+            _EMPTY_CLIPBOARD()
+            # On success the clipboard owns the memory; only free it if the hand-off failed.
+            if not _SET_CLIPBOARD_DATA(CF_UNICODETEXT, handle):
+                _GLOBAL_FREE(handle)
+                raise OSError(f"SetClipboardData failed (err={ctypes.get_last_error()}).")
+        finally:
+            _CLOSE_CLIPBOARD()
+            _DESTROY_WINDOW(owner)
 
     @staticmethod
     def ensure_windows() -> None:
         """Raise if not running on Windows."""
-        if os.name != "nt":
+        if not _IS_WINDOWS:
             raise RuntimeError("Chivalry 2 automation is only supported on Windows.")
 
     @classmethod
-    def focus_window(cls) -> None:
-        """Bring the Chivalry 2 window to the foreground.
+    def _find_window(cls) -> tuple[int, str]:
+        """Locate the best visible top-level window whose title matches Chivalry 2.
+
+        Uses a raw EnumWindows callback instead of pywinauto's Desktop().windows(), which wraps
+        every top-level window in a Python object before filtering.
+
+        Returns
+        -------
+        tuple[int, str]
+            HWND and stripped title of the best match.
 
         Raises
         ------
         RuntimeError
             If no suitable window is found.
         """
-        cls.ensure_windows()
-        from pywinauto import Desktop
+        contains = cls._CONTAINS_CF
+        preferred = cls._PREFERRED_CF
+        best: Optional[tuple[tuple[int, int], int, str]] = None
+        buf = ctypes.create_unicode_buffer(512)
+
+        def _visit(hwnd: int, _lparam: int) -> bool:
+            nonlocal best
+            if not hwnd or not _IS_WINDOW_VISIBLE(hwnd):
+                return True
+            length = _GET_WINDOW_TEXT_LENGTH(hwnd)
+            if length <= 0:
+                return True
+            target = buf if length < len(buf) else ctypes.create_unicode_buffer(length + 1)
+            _GET_WINDOW_TEXT(hwnd, target, len(target))
 
-        desktop = Desktop(backend="win32")
-        preferred = cls._match.title_exact_preferred.casefold()
-        candidates: list[tuple[tuple[int, int], object, str]] = []
-        for w in desktop.windows():
-            try:
-                if hasattr(w, "is_visible") and not w.is_visible():
-                    continue
-                title = w.window_text()
-            except Exception:
-                continue
-            if not title:
-                continue
+            title = target.value
+            # Reject the (many) non-matching windows before paying for strip().
+            title_cf = title.casefold()
+            if contains not in title_cf:
+                return True
 
             title_clean = title.strip()
-            title_cf = title_clean.casefold()
-            if cls._match.title_contains not in title_cf:
-                continue
-
+            title_cf = title_cf.strip()
             if title_cf == preferred:
-                score = (0, len(title_clean))
-            elif preferred in title_cf:
-                score = (1, len(title_clean))
-            else:
-                score = (2, len(title_clean))
-            candidates.append((score, w, title_clean))
-
-        if not candidates:
+                # Exact title can't be beaten: stop enumerating.
+                best = ((0, len(title_clean)), int(hwnd), title_clean)
+                return False
+
+            score = (1 if preferred in title_cf else 2, len(title_clean))
+            if best is None or score < best[0]:
+                best = (score, int(hwnd), title_clean)
+            return True
+
+        _ENUM_WINDOWS(WNDENUMPROC(_visit), 0)
+
+        if best is None:
             raise RuntimeError('Could not find an active "Chivalry 2" window. Make sure you are in-game.')
+        return best[1], best[2]
+
+    @classmethod
+    def _resolve_hwnd(cls) -> tuple[int, str]:
+        """Return the cached Chivalry 2 window if it is still valid, else enumerate and cache.
+
+        Only exact-title matches are cached so a launcher/fallback window never hides the game.
+        """
+        hwnd = cls._cached_hwnd
+        if hwnd and _IS_WINDOW(hwnd) and cls._get_window_text(hwnd).strip() == cls._cached_title:
+            return hwnd, cls._cached_title
+
+        hwnd, title = cls._find_window()
+        if title.casefold() == cls._PREFERRED_CF:
+            cls._cached_hwnd, cls._cached_title = hwnd, title
+        else:
+            cls._cached_hwnd = None
+        return hwnd, title
+
+    @staticmethod
+    def _wrap_window(hwnd: int):
+        """Create a pywinauto wrapper for `hwnd` (only needed for its focus/click fallbacks)."""
+        from pywinauto.controls.hwndwrapper import HwndWrapper
+
+        return HwndWrapper(hwnd)
+
+    @classmethod
+    def focus_window(cls) -> None:
+        """Bring the Chivalry 2 window to the foreground.
+
+        Raises
+        ------
+        RuntimeError
+            If no suitable window is found.
+        """
+        cls.ensure_windows()
+        # Steady state while streaming commands: the game already owns the foreground.
+        if cls._cached_hwnd and cls._get_foreground_window_handle() == cls._cached_hwnd:
+            return
+        hwnd, target_title = cls._resolve_hwnd()
 
-        candidates.sort(key=lambda item: item[0])
-        win = candidates[0][1]
-        target_title = candidates[0][2]
-        hwnd = int(win.handle)
         errors: list[Exception] = []
         try:
             cls._force_foreground_window(hwnd)
         except Exception as e:
             errors.append(e)
-        try:
-            win.set_focus()
-        except Exception as e:
-            errors.append(e)
-        if GAME_CONFIG.click_to_focus:
+        if cls._get_foreground_window_handle() != hwnd:
+            try:
+                cls._wrap_window(hwnd).set_focus()
+            except Exception as e:
+                errors.append(e)
+        if _CLICK_TO_FOCUS:
             try:
-                win.click_input(coords=(50, 50))
+                cls._wrap_window(hwnd).click_input(coords=(50, 50))
             except Exception:
                 pass
         if not cls._wait_for_foreground(hwnd):
+            cls._cached_hwnd = None
             fg_hwnd = cls._get_foreground_window_handle()
             fg_title = cls._get_window_text(fg_hwnd) if fg_hwnd else ""
             err_text = "; ".join(str(e) for e in errors if str(e))
@@ -506,89 +903,60 @@ class ChivalryConsoleAutomation:
                 f'Failed to focus "{target_title}" (0x{hwnd:08X}). '
                 f'Foreground is "{fg_title}" (0x{fg_hwnd:08X}). {err_text}'
             )
-        time.sleep(GAME_CONFIG.focus_delay_s)
+        time.sleep(_FOCUS_DELAY_S)
 
     @classmethod
     def open_console(cls) -> None:
         """Open the in-game console."""
         cls.ensure_windows()
-        if GAME_CONFIG.pre_console_escape:
+        if _PRE_CONSOLE_ESCAPE:
             try:
                 cls._press_virtual_key(0x1B)  # VK_ESCAPE
-                time.sleep(GAME_CONFIG.after_escape_delay_s)
+                time.sleep(_AFTER_ESCAPE_DELAY_S)
             except Exception:
                 pass
-        errors: list[Exception] = []
-
         # Prefer physical key delivery over text, because games often ignore character input.
         # Note: if all of these fail, we raise (rather than "typing a `") so failures are visible.
-        try:
-            cls._press_vk_keybd_event(GAME_CONFIG.console_open_vk)
-            return
-        except Exception as e:
-            errors.append(e)
-
-        try:
-            cls._press_scan_code(GAME_CONFIG.console_open_scan_code)
-            return
-        except Exception as e:
-            errors.append(e)
-
-        try:
-            cls._press_virtual_key(GAME_CONFIG.console_open_vk)
-            return
-        except Exception as e:
-            errors.append(e)
-
-        msg = "; ".join(str(e) for e in errors if str(e))
-        raise RuntimeError(f"Failed to open console. {msg}") from errors[0]
+        cls._console_strategy = cls._run_fallbacks(
+            (
+                (cls._press_vk_keybd_event, _CONSOLE_VK),
+                (cls._press_scan_code, _CONSOLE_SCAN),
+                (cls._press_virtual_key, _CONSOLE_VK),
+            ),
+            cls._console_strategy,
+            "open console",
+        )
 
     @classmethod
-    def paste_and_execute(cls, command: str, restore_clipboard: bool = True) -> None:
+    def paste_and_execute(cls, command: str) -> None:
         """Open the console, type `command`, and press Enter.
 
+        The command is injected as keystrokes and never touches the clipboard.
+
         Parameters
         ----------
         command:
             Console command to execute.
-        restore_clipboard:
-            If True, restores clipboard contents after execution.
         """
-        import pyperclip
-
-        old_clip = None
-        if restore_clipboard:
-            try:
-                old_clip = pyperclip.paste()
-            except Exception:
-                old_clip = None
-
         cls.focus_window()
 
         cls.open_console()
-        time.sleep(GAME_CONFIG.console_open_delay_s)
+        time.sleep(_CONSOLE_OPEN_DELAY_S)
         try:
-            from pywinauto.keyboard import send_keys
-
-            send_keys(command, with_spaces=True, pause=0.01)
-        except Exception:
+            # Unicode events type the same text on any layout (as pywinauto's vk_packet did), in one
+            # batched SendInput instead of per-character sends with 10 ms pauses.
             cls._send_text_unicode(command)
+        except Exception as e:
+            # Retyping after part of the command reached the console would duplicate it.
+            if isinstance(e, _SendInputError) and e.sent:
+                raise
+            cls._send_scan_string(command)
 
-        try:
-            from pywinauto.keyboard import send_keys
-
-            send_keys("{ENTER}", pause=0.02)
-        except Exception:
-            cls._press_enter()
+        # Scan-code Enter first; pywinauto's send_keys is only the last of _press_enter's fallbacks.
+        cls._press_enter()
 
         # Keep game in foreground.
-        time.sleep(GAME_CONFIG.after_command_delay_s)
-
-        if restore_clipboard and old_clip is not None:
-            try:
-                pyperclip.copy(old_clip)
-            except Exception:
-                pass
+        time.sleep(_AFTER_COMMAND_DELAY_S)
 
     @classmethod
     def paste_clipboard_and_execute(cls, command: str, restore_clipboard: bool = True) -> None:
@@ -596,40 +964,52 @@ class ChivalryConsoleAutomation:
 
         This matches the manual workflow: focus -> ` -> paste -> enter.
         """
-        import pyperclip
-
         cls.ensure_windows()
 
         old_clip = None
         if restore_clipboard:
             try:
-                old_clip = pyperclip.paste()
+                old_clip = cls.get_clipboard_text()
             except Exception:
                 old_clip = None
 
         cls.focus_window()
         cls.open_console()
-        time.sleep(GAME_CONFIG.console_open_delay_s)
+        time.sleep(_CONSOLE_OPEN_DELAY_S)
 
         try:
-            pyperclip.copy(command)
+            cls.set_clipboard_text(command)
         except Exception:
             raise RuntimeError("Failed to write command to clipboard.")
 
-        # Prefer a real Ctrl+V chord; fall back to send_keys if blocked.
         try:
-            cls._send_vk_chord(0x11, 0x56)  # VK_CONTROL + VK_V
-        except Exception:
-            from pywinauto.keyboard import send_keys
+            # Ctrl+V and Enter land in the input queue together, in order, so no pause is needed.
+            cls._send_paste_and_enter()
+        except Exception as e:
+            if isinstance(e, _SendInputError) and e.sent:
+                # Part of the batch landed, so pasting again could duplicate the command. If it
+                # stopped between Ctrl down (event 1) and Ctrl up (event 4), release Ctrl first.
+                if e.sent < 4:
+                    try:
+                        ctrl_up = (_vk_to_scan(0x11), KEYEVENTF_SCANCODE | KEYEVENTF_KEYUP)
+                        _send_keybd_inputs((ctrl_up,), "Ctrl release")
+                    except Exception:
+                        pass
+                raise
+            # Prefer a real Ctrl+V chord; fall back to send_keys if blocked.
+            try:
+                cls._send_vk_chord(0x11, 0x56)  # VK_CONTROL + VK_V
+            except Exception:
+                from pywinauto.keyboard import send_keys
 
-            send_keys("^v", pause=0.02)
+                send_keys("^v", pause=0.02)
 
-        time.sleep(0.05)
-        cls._press_enter()
-        time.sleep(GAME_CONFIG.after_command_delay_s)
+            time.sleep(0.05)
+            cls._press_enter()
+        time.sleep(_AFTER_COMMAND_DELAY_S)
 
         if restore_clipboard and old_clip is not None:
             try:
-                pyperclip.copy(old_clip)
+                cls.set_clipboard_text(old_clip)
             except Exception:
                 pass
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from urllib.parse import urljoin
 
 from admin_panel_automation.browser.session import BrowserSession
 from admin_panel_automation.config import SELECTORS, WEB_APP_CONFIG
 from admin_panel_automation.models import ParseResult
 from admin_panel_automation.services.chivalry_console import ChivalryConsoleAutomation
 
+# Assigns the textarea value through the native setter (so framework-managed inputs notice it) and
+# fires the events a user edit would.
+_SET_TEXTAREA_VALUE_JS = """
+(el, value) => {
+    const setter = Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, "value").set;
+    setter.call(el, value);
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+}
+"""
+
+# Absolute URL the submit button posts to (a formaction on the button overrides the form's action).
+_SUBMIT_ACTION_JS = """
+(btn) => (btn.hasAttribute("formaction") ? btn.formAction : btn.form.action)
+"""
+
 
 class PlayerListService:
     """Captures Chivalry 2 `listplayers` output into clipboard, then submits it to the web app."""
@@ -25,7 +41,7 @@ class PlayerListService:
         """
         self._session = session
 
-    def parse_and_submit(self) -> ParseResult:
+    async def parse_and_submit(self) -> ParseResult:
         """Run listplayers in-game, read clipboard, and submit to the web app.
 
         Returns
@@ -39,15 +55,16 @@ class PlayerListService:
             return ParseResult(False, str(e), 0)
 
         try:
-            clipboard_text = self._capture_listplayers_to_clipboard(timeout_s=10.0)
+            # Console automation blocks on sleeps/Win32 calls; keep it off the event loop.
+            clipboard_text = await asyncio.to_thread(self._capture_listplayers_to_clipboard, timeout_s=10.0)
         except Exception as e:
             return ParseResult(False, str(e), 0)
 
-        if not clipboard_text.strip():
+        if not clipboard_text or clipboard_text.isspace():
             return ParseResult(False, "Clipboard was empty after running listplayers.", 0)
 
         try:
-            self._submit_clipboard_to_web(clipboard_text)
+            await self._submit_clipboard_to_web(clipboard_text)
         except Exception as e:
             return ParseResult(False, f"Failed submitting to web app: {e}", len(clipboard_text))
 
@@ -72,25 +89,32 @@ class PlayerListService:
         TimeoutError
             If clipboard does not update in time.
         """
-        import pyperclip
-
         original_clip = ""
         try:
-            original_clip = pyperclip.paste() or ""
+            original_clip = ChivalryConsoleAutomation.get_clipboard_text()
         except Exception:
             original_clip = ""
 
         try:
+            # Taken before our own copy of "listplayers" so a fast game write is never missed.
+            seen_seq = ChivalryConsoleAutomation.clipboard_sequence_number()
+
             # Put the command into clipboard, then paste it in-game (Ctrl+V) and execute (Enter).
             ChivalryConsoleAutomation.paste_clipboard_and_execute("listplayers", restore_clipboard=False)
 
-            deadline = time.time() + timeout_s
-            while time.time() < deadline:
-                cur = pyperclip.paste()
-                # The game is expected to overwrite the clipboard with listplayers output.
-                if cur and cur != "listplayers" and cur != original_clip:
-                    return cur
-                time.sleep(0.25)
+            deadline = time.monotonic() + timeout_s
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Sleep until something writes to the clipboard; only then read its contents.
+                seq = ChivalryConsoleAutomation.wait_for_clipboard_change(seen_seq, remaining)
+                if seq != seen_seq:
+                    seen_seq = seq
+                    cur = ChivalryConsoleAutomation.get_clipboard_text()
+                    # The game is expected to overwrite the clipboard with listplayers output.
+                    if cur and cur != "listplayers" and cur != original_clip:
+                        return cur
 
             raise TimeoutError(
                 "Timed out waiting for player list to populate the clipboard. "
@@ -99,29 +123,58 @@ class PlayerListService:
         finally:
             # Don't leave listplayers in the clipboard if capture fails.
             try:
-                cur = pyperclip.paste() or ""
+                cur = ChivalryConsoleAutomation.get_clipboard_text()
                 if cur == "listplayers":
-                    pyperclip.copy(original_clip)
+                    ChivalryConsoleAutomation.set_clipboard_text(original_clip)
             except Exception:
                 pass
 
-    def _submit_clipboard_to_web(self, clipboard_text: str) -> None:
+    async def _submit_clipboard_to_web(self, clipboard_text: str) -> None:
         """Fill textarea#listplayerdata and click Submit."""
-        self._session.ensure_ready()
-        page = self._session.get_or_create_app_page(WEB_APP_CONFIG.base_url, bring_to_front=False)
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        await self._session.ensure_ready()
+        page = await self._session.get_or_create_app_page(WEB_APP_CONFIG.base_url, bring_to_front=False)
 
-        page.goto(WEB_APP_CONFIG.base_url, wait_until="domcontentloaded")
+        # Repeat submissions land back on the base page; only navigate when we're elsewhere.
+        if page.url.rstrip("/") != WEB_APP_CONFIG.base_url.rstrip("/"):
+            await page.goto(WEB_APP_CONFIG.base_url, wait_until="domcontentloaded")
+        else:
+            # A tab just opened by get_or_create_app_page has only committed; count() doesn't wait.
+            await page.wait_for_load_state("domcontentloaded")
 
-        if page.locator(SELECTORS.profile_anchor).count() == 0:
+        if await page.locator(SELECTORS.profile_anchor).count() == 0:
             raise RuntimeError("Not authenticated. Please Authenticate again.")
 
         textarea = page.locator(SELECTORS.listplayers_textarea)
-        textarea.wait_for(state="visible", timeout=15000)
-        textarea.fill(clipboard_text)
+        await textarea.wait_for(state="visible", timeout=15000)
+        await textarea.evaluate(_SET_TEXTAREA_VALUE_JS, clipboard_text)
 
-        page.locator(SELECTORS.listplayers_submit).click()
+        submit = page.locator(SELECTORS.listplayers_submit)
+        # Request URLs never carry a fragment, so drop it before comparing.
+        action = (await submit.evaluate(_SUBMIT_ACTION_JS)).split("#", 1)[0]
 
+        # Resolve on the form's own POST rather than networkidle, which always adds 500 ms of
+        # quiet time; matching the action URL keeps analytics/background XHRs from resolving it.
+        clicked = False
         try:
-            page.wait_for_load_state("networkidle", timeout=15000)
+            async with page.expect_response(
+                lambda r: r.request.method == "POST" and r.url == action, timeout=15000
+            ) as response_info:
+                await submit.click()
+                clicked = True
+            response = await response_info.value
         except PlaywrightTimeoutError:
-            pass
+            # Only the response wait is best-effort; a click that never happened is a failure.
+            if not clicked:
+                raise
+            return
+
+        # The profile check above may have run against a page loaded before the server session
+        # expired; an expired session answers the POST with a redirect to the login page.
+        if 300 <= response.status < 400:
+            target = urljoin(response.url, response.headers.get("location", ""))
+            if target.split("?", 1)[0].rstrip("/") == WEB_APP_CONFIG.login_url.rstrip("/"):
+                raise RuntimeError("Not authenticated. Please Authenticate again.")
+        if response.status >= 400:
+            raise RuntimeError(f"Web app rejected the submission (HTTP {response.status}).")
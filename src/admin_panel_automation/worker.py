@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import queue
+import asyncio
 import threading
 from concurrent.futures import Future
-from typing import Callable, Dict, Tuple
+from typing import Coroutine
 
-from admin_panel_automation.browser.session import AppPaths, BrowserSession
+from admin_panel_automation.browser.session import AppPaths, BrowserSessionPool
 from admin_panel_automation.models import BrowserType, AdminActionResult, AuthResult, ParseResult
 from admin_panel_automation.services.admin_action import AdminActionService
 from admin_panel_automation.services.auth import AuthService
@@ -16,7 +16,7 @@ from admin_panel_automation.config import WEB_APP_CONFIG
 
 
 class AutomationWorker(threading.Thread):
-    """Single-threaded worker to keep Playwright off the Tk GUI thread."""
+    """Single-threaded worker hosting the asyncio loop that drives Playwright off the Tk GUI thread."""
 
     def __init__(self, paths: AppPaths) -> None:
         """Create the worker.
@@ -28,32 +28,53 @@ class AutomationWorker(threading.Thread):
         """
         super().__init__(daemon=True)
         self._paths = paths
-        self._tasks: "queue.Queue[tuple[Callable[[], object], Future]]" = queue.Queue()
-        self._stop = threading.Event()
-        self._sessions: Dict[Tuple[BrowserType, str], BrowserSession] = {}
+        self._loop = asyncio.new_event_loop()
+        self._pool = BrowserSessionPool(paths)
+        # Strong refs for fire-and-forget tasks; the loop itself only keeps weak ones.
+        self._background: set[asyncio.Task] = set()
 
     def run(self) -> None:
-        """Execute submitted tasks sequentially."""
-        while not self._stop.is_set():
-            try:
-                fn, fut = self._tasks.get(timeout=0.2)
-            except queue.Empty:
-                continue
-
-            if fut.set_running_or_notify_cancel():
-                try:
-                    fut.set_result(fn())
-                except Exception as e:
-                    fut.set_exception(e)
+        """Run the event loop until shutdown."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
 
     def shutdown(self) -> None:
-        """Stop the worker and close all sessions."""
-        self._stop.set()
-        for session in self._sessions.values():
-            try:
-                session.close()
-            except Exception:
-                pass
+        """Close all sessions on the loop, then stop the worker."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._submit(self._pool.close_all()).result(timeout=10)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def prewarm(self) -> None:
+        """Start the Playwright driver in the background so the first Authenticate is fast."""
+        self._push(self._pool.prewarm())
+
+    def _submit(self, coro: Coroutine) -> Future:
+        """Schedule `coro` on the worker loop and return a thread-safe Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _push(self, coro: Coroutine) -> None:
+        """Schedule `coro` on the worker loop without allocating a result Future."""
+        self._loop.call_soon_threadsafe(self._start_background, coro)
+
+    def _start_background(self, coro: Coroutine) -> None:
+        """Start a fire-and-forget task on the loop thread and keep it alive until done."""
+        task = self._loop.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background_done)
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        """Drop the finished task; its failure is best-effort and deliberately ignored."""
+        self._background.discard(task)
+        if not task.cancelled():
+            # Mark the exception retrieved so asyncio doesn't report it at garbage collection.
+            task.exception()
 
     def submit_auth(self, browser_type: BrowserType, username: str, password: str) -> Future:
         """Submit an authentication task.
@@ -64,17 +85,11 @@ class AutomationWorker(threading.Thread):
             Resolves to AuthResult.
         """
 
-        def _task() -> AuthResult:
-            key = (browser_type, username.casefold())
-            session = self._sessions.get(key)
-            if session is None:
-                session = BrowserSession(browser_type=browser_type, username=username, paths=self._paths)
-                self._sessions[key] = session
-            return AuthService(session).authenticate(username=username, password=password)
+        async def _task() -> AuthResult:
+            session = await self._pool.acquire(browser_type, username)
+            return await AuthService(session).authenticate(username=username, password=password)
 
-        fut: Future = Future()
-        self._tasks.put((_task, fut))
-        return fut
+        return self._submit(_task())
 
     def submit_parse_player_list(self, browser_type: BrowserType, username: str) -> Future:
         """Submit a Parse Player List task.
@@ -85,17 +100,14 @@ class AutomationWorker(threading.Thread):
             Resolves to ParseResult.
         """
 
-        def _task() -> ParseResult:
-            key = (browser_type, username.casefold())
-            session = self._sessions.get(key)
+        async def _task() -> ParseResult:
+            session = self._pool.get(browser_type, username)
             if session is None:
                 return ParseResult(False, "No active authenticated session found. Authenticate first.", 0)
 
-            return PlayerListService(session).parse_and_submit()
+            return await PlayerListService(session).parse_and_submit()
 
-        fut: Future = Future()
-        self._tasks.put((_task, fut))
-        return fut
+        return self._submit(_task())
 
     def submit_execute_admin_action(self, browser_type: BrowserType, username: str) -> Future:
         """Submit an Execute Admin Action task.
@@ -106,14 +118,12 @@ class AutomationWorker(threading.Thread):
             Resolves to AdminActionResult.
         """
 
-        def _task() -> AdminActionResult:
-            key = (browser_type, username.casefold())
-            session = self._sessions.get(key)
+        async def _task() -> AdminActionResult:
+            session = self._pool.get(browser_type, username)
             if session is None:
                 return AdminActionResult(False, "No active authenticated session found. Authenticate first.", None)
 
-            return AdminActionService().execute_from_clipboard()
+            # Console automation is blocking Win32 work; run it off the event loop.
+            return await asyncio.to_thread(AdminActionService().execute_from_clipboard)
 
-        fut: Future = Future()
-        self._tasks.put((_task, fut))
-        return fut
+        return self._submit(_task())